@@ -1,9 +1,9 @@
 """测试信息提取功能"""
 
-from main import InfoExtractor
+from main import get_info_extractor
 
-# 创建提取器
-extractor = InfoExtractor()
+# 获取提取器（进程内单例）
+extractor = get_info_extractor()
 
 # 测试文件名解析
 print("=" * 60)
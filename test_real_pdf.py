@@ -1,11 +1,11 @@
 """测试真实PDF文件提取"""
 
 from pathlib import Path
-from main import PDFExtractor, InfoExtractor
+from main import get_pdf_extractor, get_info_extractor
 
-# 创建提取器
-pdf_extractor = PDFExtractor()
-info_extractor = InfoExtractor()
+# 获取提取器（进程内单例）
+pdf_extractor = get_pdf_extractor()
+info_extractor = get_info_extractor()
 
 # 测试文件
 test_file = Path("datas/饶璐的简历.pdf")